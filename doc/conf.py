@@ -26,6 +26,12 @@ exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
 from sphinx_gallery.sorting import ExplicitOrder, FileNameSortKey
 
+# Examples gating model summaries behind AKIDA_VERBOSE still display them in
+# the documentation
+import os
+
+os.environ.setdefault('AKIDA_VERBOSE', '1')
+
 sphinx_gallery_conf = {
     'default_thumb_file':
         'doc/img/brn.png',
@@ -77,8 +77,8 @@ potentials_keras = model_keras_quantized_pretrained.predict(x_test, batch_size=1
 end = timer()
 print(f'Keras inference on {num_images} images took {end-start:.2f} s.\n')
 
-preds_keras = np.squeeze(np.argmax(potentials_keras, 1))
-accuracy_keras = np.sum(np.equal(preds_keras, labels_test)) / num_images
+preds_keras = potentials_keras.argmax(1)
+accuracy_keras = float((preds_keras == labels_test).mean())
 print(f"Keras accuracy: {accuracy_keras*num_images:.0f}/{num_images}.")
 
 ######################################################################
@@ -246,7 +246,7 @@ fig, imgobj, ax1, rects = prepare_plots()
 img = np.random.randint(num_images)
 
 # Predict image class
-outputs_akida = model_akida.predict(np.expand_dims(x_test[img], axis=0)).squeeze()
+outputs_akida = model_akida.predict(x_test[img:img + 1]).squeeze()
 
 # Get top 5 prediction labels and associated names
 true_label = labels_test[img]
@@ -182,7 +182,7 @@ assert binary_iou > 0.9
 import matplotlib.pyplot as plt
 
 # Estimate age on a random single image and display Keras and Akida outputs
-sample = np.expand_dims(x_val[id, :], 0)
+sample = x_val[id:id + 1]
 keras_out = model_keras(sample)
 akida_out = tf.keras.activations.sigmoid(model_akida.forward(sample.astype('uint8')))
 
@@ -170,18 +170,28 @@ tutorial explains how to build an optimized ViT using Akida models python API fo
 # Visit our `Transfer Learning Example <plot_4_transfer_learning.html>`__ to learn more about Transfer
 # Learning using the `Akida models python package <../../api_reference/akida_models_apis.html>`__. The
 # following code snippet downloads a pre-trained model that can be used for Transfer Learning.
+#
+# .. note:: Model summaries in this tutorial are only printed when the ``AKIDA_VERBOSE`` environment
+#           variable is set to a value other than ``0`` or ``false`` (e.g. ``AKIDA_VERBOSE=1``).
 
 # The following is the API download the vit_t16 model trained on ImageNet dataset
+import os
+
 from akida_models import fetch_file
 from akida_models.model_io import load_model
 
+# Model summaries walk through all the ViT layers, they are only displayed when the AKIDA_VERBOSE
+# environment variable is enabled
+VERBOSE = os.environ.get('AKIDA_VERBOSE', '0').lower() not in ('', '0', 'false')
+
 # Retrieve the float model with pretrained weights and load it
 model_file = fetch_file(
     fname="bc_vit_ti16_224.h5",
     origin="https://data.brainchip.com/models/AkidaV2/vit/bc_vit_ti16_224.h5",
     cache_subdir='models/akidanet_imagenet')
 model_keras = load_model(model_file)
-model_keras.summary()
+if VERBOSE:
+    model_keras.summary()
 
 ######################################################################
 # .. note:: The models in Section 3 have floating point weights. Once the desired accuracy is obtained,
@@ -219,7 +229,8 @@ qparams = QuantizationParams(weight_bits=8, activation_bits=8)
 
 # Quantize the model defined in Section 3.2
 model_quantized = quantize(model_keras, qparams=qparams)
-model_quantized.summary()
+if VERBOSE:
+    model_quantized.summary()
 
 ######################################################################
 # The `bc_vit_ti16_imagenet_pretrained helper
@@ -245,7 +256,8 @@ from akida_models import bc_vit_ti16_imagenet_pretrained
 
 # Load the pre-trained quantized model
 model_quantized = bc_vit_ti16_imagenet_pretrained()
-model_quantized.summary()
+if VERBOSE:
+    model_quantized.summary()
 
 
 ######################################################################
@@ -261,7 +273,8 @@ from cnn2snn import convert
 
 # Convert the model
 model_akida = convert(model_quantized)
-model_akida.summary()
+if VERBOSE:
+    model_akida.summary()
 
 
 ######################################################################
@@ -308,7 +321,11 @@ from quantizeml.tensors import FixedPoint
 from quantizeml.models.transforms.transforms_utils import get_layers_by_type
 
 
-def build_attention_map(model, image):
+# Attention weights extractors, built once per model and indexed by the model id
+_ATTN_EXTRACTORS = {}
+
+
+def build_attention_maps(model, images):
     # Get the Attention layers list
     attentions = get_layers_by_type(model, Attention)
 
@@ -316,44 +333,77 @@ def build_attention_map(model, image):
     num_tokens = sum(isinstance(ly, ClassToken) for ly in model.layers)
     grid_size = int(np.sqrt(attentions[0].output_shape[0][-2] - num_tokens))
 
-    # Get the attention weights from each transformer
-    outputs = [la.output[1] for la in attentions]
-    weights = Model(inputs=model.inputs, outputs=outputs).predict(np.expand_dims(image, 0))
-
-    # Converts to float if needed
-    weights = [w.to_float() if isinstance(w, FixedPoint) else w for w in weights]
-    weights = np.array(weights)
-
-    # Heads number
-    num_heads = weights.shape[2]
-    num_layers = weights.shape[0]
-    reshaped = weights.reshape((num_layers, num_heads, grid_size**2 + 1, grid_size**2 + 1))
-
-    # Average the attention weights across all heads
-    reshaped = reshaped.mean(axis=1)
-
-    # To account for residual connections, we add an identity matrix to the attention matrix and
-    # re-normalize the weights.
-    reshaped = reshaped + np.eye(reshaped.shape[1])
-    reshaped = reshaped / reshaped.sum(axis=(1, 2))[:, np.newaxis, np.newaxis]
-
-    # Recursively multiply the weight matrices
-    v = reshaped[-1]
-    for n in range(1, len(reshaped)):
-        v = np.matmul(v, reshaped[-1 - n])
-
-    # Attention from the output token to the input space
-    mask = v[0, 1:].reshape(grid_size, grid_size)
-    mask = cv2.resize(mask / mask.max(), (image.shape[1], image.shape[0]))[..., np.newaxis]
-    return (mask * image).astype("uint8")
-
-
-# Using a specific image for which attention map is easier to observe
-image = x_test[8]
+    # Get the attention weights from each transformer for the whole batch. The extractor is stored
+    # along with the model so that the id cannot be reused by another model.
+    entry = _ATTN_EXTRACTORS.get(id(model))
+    if entry is None:
+        outputs = [la.output[1] for la in attentions]
+        entry = _ATTN_EXTRACTORS[id(model)] = (model, Model(inputs=model.inputs, outputs=outputs))
+    extractor = entry[1]
+    weights = extractor(images, training=False)
+
+    # Sum the attention weights across all heads and, to account for residual connections, add an
+    # identity matrix scaled by the number of heads to the attention matrix. This is the average
+    # across heads plus identity up to a per-layer scale factor, that is removed by normalization.
+    # Each layer weights, shaped as (batch, heads, tokens, tokens), are reduced straight into a
+    # preallocated (layers, batch, tokens, tokens) buffer so that the weights of all heads are never
+    # stacked together and are read only once.
+    quantized = isinstance(weights[0], FixedPoint)
+    batch_size, num_heads, seq_len = weights[0].shape[:3]
+    diagonal = np.arange(seq_len)
+    reshaped = np.empty((len(weights), batch_size, seq_len, seq_len),
+                        dtype=np.int32 if quantized else np.float32)
+    for layer, w in zip(reshaped, weights):
+        if quantized:
+            # Quantized attention scores are kept as integers, the identity then being the fixed
+            # point representation of one. The per-layer scale factor cancels out when normalizing
+            # the mask, so the integer weights are not re-normalized.
+            values, one = w.values.numpy(), 1 << int(w.frac_bits)
+        else:
+            values, one = w, 1
+        np.sum(values, axis=1, dtype=reshaped.dtype, out=layer)
+        layer[..., diagonal, diagonal] += num_heads * one
+    if not quantized:
+        # Re-normalize the float weights in place
+        reshaped /= reshaped.sum(axis=(2, 3), keepdims=True)
+
+    # Recursively multiply the weight matrices of all images at once, using batched matrix products.
+    # Only the class token row of the product is needed, so the chain starts from that row and is
+    # evaluated as a sequence of vector-matrix products.
+    v = reshaped[-1, :, :1].astype(np.int64 if quantized else np.float32)
+    for matrix in reshaped[-2::-1]:
+        v = v @ matrix
+        if quantized:
+            # Integer products are accumulated on 64-bit and shifted right after each step so that
+            # the class token row of each image stays within 24 bits.
+            bit_length = np.frexp(v.max(axis=(1, 2)))[1]
+            v >>= np.maximum(0, bit_length - 24)[:, np.newaxis, np.newaxis]
+
+    # Attention from the output token to the input space, normalized to 8-bit. The integer rollout
+    # is normalized with an integer division so that it is never converted to float.
+    masks = v[:, 0, 1:].reshape(-1, grid_size, grid_size)
+    if quantized:
+        masks = masks * 255 // masks.max(axis=(1, 2), keepdims=True)
+    else:
+        masks = masks * (255 / masks.max(axis=(1, 2), keepdims=True))
+    masks = masks.astype(np.uint8)
+
+    # Resize the masks and apply them on the images in the uint8 domain
+    attention_maps = np.empty_like(images)
+    for image, mask, attention_map in zip(images, masks, attention_maps):
+        mask = cv2.resize(mask, (image.shape[1], image.shape[0]), interpolation=cv2.INTER_LINEAR)
+        cv2.multiply(image, cv2.merge([mask] * image.shape[-1]), dst=attention_map, scale=1 / 255)
+    return attention_maps
+
+
+# Using a specific image for which attention map is easier to observe. The image is sliced as a
+# batch of one sample, that is shared by both models.
+image_batch = x_test[8:9]
+image = image_batch[0]
 
 # Compute the attention map
-attention_float = build_attention_map(model_keras, image)
-attention_quantized = build_attention_map(model_quantized, image)
+attention_float = build_attention_maps(model_keras, image_batch)[0]
+attention_quantized = build_attention_maps(model_quantized, image_batch)[0]
 
 # Display the attention map
 fig, (ax1, ax2, ax3) = plt.subplots(ncols=3)
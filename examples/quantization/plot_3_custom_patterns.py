@@ -103,7 +103,7 @@ def evaluate_onnx_model(model):
     # Calculate outputs by running images through the session
     outputs = sess.run(None, {model.graph.input[0].name: x_test})
     # The class with the highest score is what we choose as prediction
-    predicted = np.squeeze(np.argmax(outputs[0], 1))
+    predicted = outputs[0].argmax(1)
     # Compute the number of valid predictions
     return int((predicted == labels_test).sum())
 